@@ -1,5 +1,5 @@
-import inspect
 import sys
+import types
 
 __version__ = "16.1.0"
 
@@ -73,14 +73,19 @@ def get_all(name, objects_to_skip=None, skip_private=True):
     #    __all__ will be set equal to ['MyDataClass', '_my_private_foo', 'dataclass', 'my_func']
     """
 
-    # Get all objects from the calling code
-    item_list = [
+    # Get all objects from the calling code.
+    # Scan the module's namespace directly; `inspect.getmembers()` would
+    # also resolve every attribute via getattr(), and this is called twice
+    # per submodule while importing nisarqa.
+    item_list = sorted(
         name
-        for name, obj in inspect.getmembers(sys.modules[name])
-        if (inspect.isfunction(obj) or inspect.isclass(obj))
-    ]
+        for name, obj in vars(sys.modules[name]).items()
+        if isinstance(obj, (types.FunctionType, type))
+    )
 
     if objects_to_skip is not None:
+        # Use a set for O(1) membership tests
+        objects_to_skip = frozenset(objects_to_skip)
         item_list = [x for x in item_list if (x not in objects_to_skip)]
 
     # Remove objects that start with an underscore
@@ -11,6 +11,30 @@ import argparse
 
 import nisarqa
 
+# Runconfig parameter class for each `dumpconfig` product type
+_DUMPCONFIG_ROOT_PARAMS = {
+    "rslc": nisarqa.RSLCRootParamGroup,
+    "gslc": nisarqa.GSLCRootParamGroup,
+    "gcov": nisarqa.GCOVRootParamGroup,
+    "rifg": nisarqa.RIFGRootParamGroup,
+    "runw": nisarqa.RUNWRootParamGroup,
+    "gunw": nisarqa.GUNWRootParamGroup,
+    "roff": nisarqa.ROFFRootParamGroup,
+    "goff": nisarqa.GOFFRootParamGroup,
+}
+
+# QA workflow for each `*_qa` sub-command
+_QA_WORKFLOWS = {
+    "rslc_qa": nisarqa.rslc_qa,
+    "gslc_qa": nisarqa.gslc_qa,
+    "gcov_qa": nisarqa.gcov_qa,
+    "rifg_qa": nisarqa.igram_qa,
+    "runw_qa": nisarqa.igram_qa,
+    "gunw_qa": nisarqa.igram_qa,
+    "roff_qa": nisarqa.offsets_qa,
+    "goff_qa": nisarqa.offsets_qa,
+}
+
 
 def parse_cli_args():
     """
@@ -130,27 +154,13 @@ def dumpconfig(product_type, indent=4):
             f" {nisarqa.LIST_OF_NISAR_PRODUCTS}"
         )
 
-    if product_type == "rslc":
-        nisarqa.RSLCRootParamGroup.dump_runconfig_template(indent=indent)
-    elif product_type == "gslc":
-        nisarqa.GSLCRootParamGroup.dump_runconfig_template(indent=indent)
-    elif product_type == "gcov":
-        nisarqa.GCOVRootParamGroup.dump_runconfig_template(indent=indent)
-    elif product_type == "rifg":
-        nisarqa.RIFGRootParamGroup.dump_runconfig_template(indent=indent)
-    elif product_type == "runw":
-        nisarqa.RUNWRootParamGroup.dump_runconfig_template(indent=indent)
-    elif product_type == "gunw":
-        nisarqa.GUNWRootParamGroup.dump_runconfig_template(indent=indent)
-    elif product_type == "roff":
-        nisarqa.ROFFRootParamGroup.dump_runconfig_template(indent=indent)
-    elif product_type == "goff":
-        nisarqa.GOFFRootParamGroup.dump_runconfig_template(indent=indent)
-    else:
+    if product_type not in _DUMPCONFIG_ROOT_PARAMS:
         raise NotImplementedError(
             f"{product_type} dumpconfig code not implemented yet."
         )
 
+    _DUMPCONFIG_ROOT_PARAMS[product_type].dump_runconfig_template(indent=indent)
+
 
 def run():
     # parse the args
@@ -195,19 +205,11 @@ def run():
 
         nisarqa.set_global_scratch_dir(scratch_dir)
 
-        if subcommand == "rslc_qa":
-            nisarqa.rslc_qa(root_params=root_params, verbose=verbose)
-        elif subcommand == "gslc_qa":
-            nisarqa.gslc_qa(root_params=root_params, verbose=verbose)
-        elif subcommand == "gcov_qa":
-            nisarqa.gcov_qa(root_params=root_params, verbose=verbose)
-        elif subcommand in ("rifg_qa", "runw_qa", "gunw_qa"):
-            nisarqa.igram_qa(root_params=root_params, verbose=verbose)
-        elif subcommand in ("roff_qa", "goff_qa"):
-            nisarqa.offsets_qa(root_params=root_params, verbose=verbose)
-        else:
+        if subcommand not in _QA_WORKFLOWS:
             raise ValueError(f"Unknown subcommand: {subcommand}")
 
+        _QA_WORKFLOWS[subcommand](root_params=root_params, verbose=verbose)
+
 
 def main():
     log = nisarqa.get_logger()
@@ -46,6 +46,29 @@ FIG_SIZE_THREE_PLOTS_PER_PAGE_STACKED = (6.4, 9.6)
 
 PI_UNICODE = "\u03c0"
 
+# HDF5 raw data chunk cache settings for file handles used to read raster
+# imagery from the input product. The h5py default cache (1 MiB) is smaller
+# than a single chunk of a typical NISAR raster, so tiles that straddle chunk
+# boundaries would otherwise re-read and re-decompress the same chunks.
+# Note: `rdcc_nbytes` is a budget per open raster Dataset, so with several
+# raster handles open at once (e.g. the layers of an InSAR product), the
+# total cache memory grows with the number of open handles. 64 MiB holds
+# e.g. 32 chunks of 512x512 complex64 values.
+# `rdcc_nslots` should be a prime number, ideally ~100x the number of chunks
+# that fit in the cache.
+INPUT_H5_RASTER_CHUNK_CACHE = {
+    "rdcc_nbytes": 64 * 1024**2,
+    "rdcc_nslots": 10007,
+    "rdcc_w0": 0.75,
+}
+
+# Requested size (in bytes) of the HDF5 page buffer for file handles used to
+# read raster imagery from the input product. Only used if the input product
+# was written with the paged file space strategy. The page buffer lets HDF5
+# serve the many small metadata reads made during a raster scan from a few
+# page-sized reads of the file, instead of many small reads.
+INPUT_H5_PAGE_BUFFER_SIZE = 16 * 1024**2
+
 # This is used for logging errors during computation of statistics.
 # Ex: if a raster has greater than `STATISTICS_THRESHOLD` percent NaN values,
 # an error should be logged.
@@ -158,6 +181,8 @@ __all__ = [
     "FIG_SIZE_TWO_PLOTS_PER_PAGE",
     "FIG_SIZE_THREE_PLOTS_PER_PAGE_STACKED",
     "PI_UNICODE",
+    "INPUT_H5_RASTER_CHUNK_CACHE",
+    "INPUT_H5_PAGE_BUFFER_SIZE",
     "NUM_TRACKS",
     "NUM_FRAMES",
     "PRODUCT_SPECS_PATH",
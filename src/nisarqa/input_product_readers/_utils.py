@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterable
 from functools import lru_cache
 from typing import overload
 
@@ -177,16 +178,22 @@ def _get_path_to_nearest_dataset(
         )
 
 
-def _get_paths_in_h5(h5_file: h5py.File, name: str) -> list[str]:
+def _get_paths_with_name(
+    h5_paths: Iterable[str], name: str, parent: str | None = None
+) -> list[str]:
     """
     Return the path(s) to the `name` group or dataset in the input file.
 
     Parameters
     ----------
-    h5_file : h5py.File, h5py.Group
-        Handle to HDF5 input file or Group to be searched.
+    h5_paths : iterable of str
+        Paths to every group and dataset in the input file, e.g. as
+        generated by `h5py.Group.visit()`.
     name : str
         Base Name of a h5py.Dataset or h5py.Group to be located.
+    parent : str or None, optional
+        If provided, only paths nested under the group at this path are
+        returned. Defaults to None (search all of `h5_paths`).
 
     Returns
     -------
@@ -197,16 +204,13 @@ def _get_paths_in_h5(h5_file: h5py.File, name: str) -> list[str]:
         "science/LSAR/identification"].
         If no occurrences are found, returns an empty list.
     """
-    paths = []
+    prefix = "" if parent is None else parent.strip("/") + "/"
 
-    def get_path(path: str) -> None:
-        """Find all paths to the group or dataset specified."""
-        if path.split("/")[-1] == name:
-            paths.append(path)
-
-    h5_file.visit(get_path)
-
-    return paths
+    return [
+        path
+        for path in h5_paths
+        if path.startswith(prefix) and (path.split("/")[-1] == name)
+    ]
 
 
 def _parse_dataset_stats_from_h5(
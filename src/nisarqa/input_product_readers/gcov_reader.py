@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 
 import h5py
 import numpy as np
@@ -13,6 +14,22 @@ from .non_insar_geo_product import NonInsarGeoProduct
 
 objects_to_skip = nisarqa.get_all(name=__name__)
 
+# RGB color channel assignments for the GCOV browse image, keyed by the set of
+# on-diagonal term images provided. Values are the (red, green, blue) terms.
+_BROWSE_RGB_POLS = {
+    # Quad Pol
+    frozenset({"HHHH", "HVHV", "VVVV"}): ("HHHH", "HVHV", "VVVV"),
+    frozenset({"HHHH", "VHVH", "VVVV"}): ("HHHH", "VHVH", "VVVV"),
+    # dual pol horizontal transmit, or quasi-quad
+    frozenset({"HHHH", "HVHV"}): ("HHHH", "HVHV", "HHHH"),
+    frozenset({"HHHH", "VHVH"}): ("HHHH", "VHVH", "HHHH"),
+    # quasi-dual mode
+    frozenset({"HHHH", "VVVV"}): ("HHHH", "VVVV", "HHHH"),
+    # dual-pol only, vertical transmit
+    frozenset({"VVVV", "VHVH"}): ("VVVV", "VHVH", "VVVV"),
+    frozenset({"VVVV", "HVHV"}): ("VVVV", "HVHV", "VVVV"),
+}
+
 
 @dataclass
 class GCOV(NonInsarGeoProduct):
@@ -246,10 +263,10 @@ class GCOV(NonInsarGeoProduct):
         # WLOG, get the shape of the image arrays
         # They should all be the same shape; the check for this is below.
         first_img = next(iter(pol_imgs.values()))
-        img_2D_shape = np.shape(first_img)
+        img_2D_shape = first_img.shape
         for img in pol_imgs.values():
             # Input validation check
-            if np.shape(img) != img_2D_shape:
+            if img.shape != img_2D_shape:
                 raise ValueError(
                     "All image arrays in `pol_imgs` must have the same shape."
                 )
@@ -270,16 +287,6 @@ class GCOV(NonInsarGeoProduct):
             # Return early, so that we do not try to plot to RGB
             return
 
-        # Initialize variables. Later, check to ensure they were all used.
-        red = None
-        blue = None
-        green = None
-
-        for pol in ["HHHH", "VVVV"]:
-            if pol in pol_imgs:
-                red = pol_imgs[pol]
-                break
-
         # There should only be one cross-pol in the input
         if ("HVHV" in pol_imgs) and ("VHVH" in pol_imgs):
             raise ValueError(
@@ -288,25 +295,10 @@ class GCOV(NonInsarGeoProduct):
                 "`_select_layers_for_gcov_browse()`"
             )
 
-        for pol in ["HVHV", "VHVH", "VVVV"]:
-            if pol in pol_imgs:
-                green = pol_imgs[pol]
-
-                if pol == "VVVV":
-                    # If we get here, this means two things:
-                    #   1: no cross-pol images were available
-                    #   2: only HHHH and VVVV are available
-                    # So, final assignment should be R: HHHH, G: VVVV, B: HHHH
-                    blue = pol_imgs["HHHH"]
-                else:
-                    for pol2 in ["VVVV", "HHHH"]:
-                        if pol2 in pol_imgs:
-                            blue = pol_imgs[pol2]
-                            break
-                break
+        rgb_pols = _BROWSE_RGB_POLS.get(frozenset(pol_imgs))
 
         # Sanity Check, and catch-all logic to make a browse image
-        if any(arr is None for arr in (red, green, blue)):
+        if rgb_pols is None:
             # If we get here, then the images provided are not one of the
             # expected cases. WLOG plot one of the image(s) in `pol_imgs`.
             nisarqa.get_logger().warning(
@@ -315,13 +307,13 @@ class GCOV(NonInsarGeoProduct):
                 " default."
             )
 
-            for gray_img in pol_imgs.values():
-                nisarqa.plot_to_grayscale_png(
-                    img_arr=gray_img, filepath=filepath
-                )
+            # WLOG, use the last image in `pol_imgs`.
+            *_, gray_img = pol_imgs.values()
+            nisarqa.plot_to_grayscale_png(img_arr=gray_img, filepath=filepath)
 
         else:
             # Output the RGB Browse Image
+            red, green, blue = (pol_imgs[pol] for pol in rgb_pols)
             nisarqa.plot_to_rgb_png(
                 red=red, green=green, blue=blue, filepath=filepath
             )
@@ -343,6 +335,12 @@ class GCOV(NonInsarGeoProduct):
         KeyError
             If `listOfCovarianceTerms` is missing.
         """
+        # `get_pols()` checks against this on every call, so read and
+        # validate each frequency's list once. Only successful reads are
+        # cached, so an invalid list raises again on every query for that
+        # frequency, and does not affect queries for the other frequency.
+        if freq in self._lists_of_covariance_terms:
+            return self._lists_of_covariance_terms[freq]
 
         # `listOfCovarianceTerms` is always a child of the frequency group.
         freq_group = self.get_freq_path(freq=freq)
@@ -376,7 +374,19 @@ class GCOV(NonInsarGeoProduct):
                     f" {list_of_cov}, but must be a subset of {poss_pols}."
                 )
 
-            return tuple(list_of_cov)
+        self._lists_of_covariance_terms[freq] = tuple(list_of_cov)
+
+        return self._lists_of_covariance_terms[freq]
+
+    @cached_property
+    def _lists_of_covariance_terms(self) -> dict[str, tuple[str, ...]]:
+        """
+        Per-frequency cache for `get_list_of_covariance_terms()`.
+
+        Maps each frequency ("A" and/or "B") that has been successfully
+        queried to the contents of its `listOfCovarianceTerms` dataset.
+        """
+        return {}
 
 
 __all__ = nisarqa.get_all(__name__, objects_to_skip)
@@ -15,7 +15,7 @@ from ._utils import (
     _get_fill_value,
     _get_or_create_cached_memmap,
     _get_path_to_nearest_dataset,
-    _get_paths_in_h5,
+    _get_paths_with_name,
     _get_units,
     _parse_dataset_stats_from_h5,
 )
@@ -59,23 +59,23 @@ class NisarGeoProduct(NisarProduct):
     @cached_property
     def epsg(self) -> str:
         """EPSG code for input product."""
-        with h5py.File(self.filepath) as f:
-            # EPSG code is consistent for both frequencies. WLOG pick the
-            # science frequency.
-            freq_path = self.get_freq_path(freq=self.science_freq)
-
-            # Get the sub path to an occurrence of a `projection` dataset
-            # for the chosen frequency. (Again, they're all the same.)
-            proj_path = _get_paths_in_h5(
-                h5_file=f[freq_path], name="projection"
-            )
-            try:
-                proj_path = "/".join([freq_path, proj_path[0]])
-            except IndexError as exc:
-                raise nisarqa.DatasetNotFoundError(
-                    "no projection path found"
-                ) from exc
+        # EPSG code is consistent for both frequencies. WLOG pick the
+        # science frequency.
+        freq_path = self.get_freq_path(freq=self.science_freq)
+
+        # Get the path to an occurrence of a `projection` dataset
+        # for the chosen frequency. (Again, they're all the same.)
+        proj_path = _get_paths_with_name(
+            self._h5_paths, name="projection", parent=freq_path
+        )
+        try:
+            proj_path = proj_path[0]
+        except IndexError as exc:
+            raise nisarqa.DatasetNotFoundError(
+                "no projection path found"
+            ) from exc
 
+        with h5py.File(self.filepath) as f:
             return f[proj_path][...]
 
     @property
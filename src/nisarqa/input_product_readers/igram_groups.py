@@ -4,8 +4,6 @@ from abc import abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 
-import h5py
-
 import nisarqa
 
 from .insar_product import InsarProduct
@@ -58,7 +56,7 @@ class WrappedGroup(InsarProduct):
         parent_path = self._wrapped_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/wrappedInterferogram"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -83,7 +81,7 @@ class WrappedGroup(InsarProduct):
         parent_path = self._wrapped_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/coherenceMagnitude"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -126,7 +124,7 @@ class UnwrappedGroup(InsarProduct):
         parent_path = self._unwrapped_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/unwrappedPhase"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -151,7 +149,7 @@ class UnwrappedGroup(InsarProduct):
         parent_path = self._unwrapped_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/connectedComponents"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=False
             )
@@ -176,7 +174,7 @@ class UnwrappedGroup(InsarProduct):
         parent_path = self._unwrapped_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/coherenceMagnitude"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -201,7 +199,7 @@ class UnwrappedGroup(InsarProduct):
         parent_path = self._unwrapped_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/ionospherePhaseScreen"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -226,7 +224,7 @@ class UnwrappedGroup(InsarProduct):
         parent_path = self._unwrapped_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/ionospherePhaseScreenUncertainty"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -279,7 +277,7 @@ class IgramOffsetsGroup(InsarProduct):
         parent_path = self._igram_offsets_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/alongTrackOffset"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -304,7 +302,7 @@ class IgramOffsetsGroup(InsarProduct):
         parent_path = self._igram_offsets_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/slantRangeOffset"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -329,7 +327,7 @@ class IgramOffsetsGroup(InsarProduct):
         parent_path = self._igram_offsets_group_path(freq=freq, pol=pol)
         path = f"{parent_path}/correlationSurfacePeak"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
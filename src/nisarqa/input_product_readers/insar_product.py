@@ -138,15 +138,13 @@ class InsarProduct(NisarProduct):
             with h5py.File(self.filepath) as f:
                 for pol in nisarqa.get_possible_pols(self.product_type.lower()):
                     pol_path = self._get_path_containing_freq_pol(freq, pol)
-                    try:
-                        f[pol_path]
-                    except KeyError:
+                    if pol_path in f:
+                        log.info(f"Located polarization group at: {pol_path}")
+                        pols.append(pol)
+                    else:
                         log.info(
                             f"Did not locate polarization group at: {pol_path}"
                         )
-                    else:
-                        log.info(f"Located polarization group at: {pol_path}")
-                        pols.append(pol)
 
             # Sanity checks
             # Check the "discovered" polarizations against the expected
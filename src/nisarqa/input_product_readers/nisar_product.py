@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from functools import cached_property, lru_cache
+from functools import cached_property
 from pathlib import Path
 
 import h5py
@@ -11,7 +12,7 @@ import numpy as np
 
 import nisarqa
 
-from ._utils import _get_path_to_nearest_dataset, _get_paths_in_h5
+from ._utils import _get_path_to_nearest_dataset, _get_paths_with_name
 
 objects_to_skip = nisarqa.get_all(name=__name__)
 
@@ -142,8 +143,7 @@ class NisarProduct(ABC):
         nisarqa.InvalidNISARProductError
             If "identification" is not found exactly one time in the input file.
         """
-        with h5py.File(self.filepath) as f:
-            paths = _get_paths_in_h5(h5_file=f, name="identification")
+        paths = _get_paths_with_name(self._h5_paths, name="identification")
 
         if len(paths) != 1:
             raise nisarqa.InvalidNISARProductError(
@@ -153,6 +153,87 @@ class NisarProduct(ABC):
 
         return paths[0]
 
+    @cached_property
+    def _h5_paths(self) -> tuple[str, ...]:
+        """
+        Paths to every Group and Dataset in the input file.
+
+        The input file's object tree is walked exactly once; subsequent
+        searches by name are answered from this in-memory listing rather
+        than by re-walking the HDF5 B-trees.
+
+        Returns
+        -------
+        paths : tuple of str
+            Paths (relative to the root Group, so without a leading "/") of
+            every Group and Dataset in the input file, in the order visited by
+            `h5py.Group.visit()`.
+        """
+        paths = []
+        with h5py.File(self.filepath) as f:
+            f.visit(paths.append)
+        return tuple(paths)
+
+    @cached_property
+    def _file_space_page_size(self) -> int | None:
+        """
+        Page size (in bytes) of the input file, if it is paged.
+
+        Returns
+        -------
+        page_size : int or None
+            The file space page size, if the input file was written with the
+            paged file space strategy. Otherwise, None.
+        """
+        with h5py.File(self.filepath) as f:
+            fcpl = f.id.get_create_plist()
+            if fcpl.get_file_space_strategy()[0] != (
+                h5py.h5f.FSPACE_STRATEGY_PAGE
+            ):
+                return None
+            return fcpl.get_file_space_page_size()
+
+    @property
+    def _raster_h5_open_kwargs(self) -> dict[str, int | float]:
+        """
+        Keyword arguments to `h5py.File` for opening the input file for rasters.
+
+        Includes the raw data chunk cache settings from
+        `nisarqa.INPUT_H5_RASTER_CHUNK_CACHE`. If the input file was written
+        with the paged file space strategy, a page buffer of (approximately)
+        `nisarqa.INPUT_H5_PAGE_BUFFER_SIZE` bytes is also requested.
+        (HDF5 does not permit a page buffer for non-paged files.)
+
+        Returns
+        -------
+        kwargs : dict
+            Keyword arguments for `h5py.File`. A new dict is returned on
+            each access.
+        """
+        kwargs = dict(nisarqa.INPUT_H5_RASTER_CHUNK_CACHE)
+
+        page_size = self._file_space_page_size
+        if page_size is not None:
+            # The page buffer size must be a multiple of the file's page size
+            n_pages = max(nisarqa.INPUT_H5_PAGE_BUFFER_SIZE // page_size, 1)
+            kwargs["page_buf_size"] = n_pages * page_size
+
+        return kwargs
+
+    @contextmanager
+    def _open_h5_for_rasters(self) -> Iterator[h5py.File]:
+        """
+        Open the input file in read mode, for reading raster imagery.
+
+        Yields
+        ------
+        h5_file : h5py.File
+            The input file, opened in read mode with the settings from
+            `_raster_h5_open_kwargs`.
+        """
+        with h5py.File(self.filepath, "r", **self._raster_h5_open_kwargs) as f:
+            yield f
+
     @cached_property
     def product_spec_version(self) -> str:
         """
@@ -167,8 +248,9 @@ class NisarProduct(ABC):
         """
         id_group = self.identification_path
         with h5py.File(self.filepath) as f:
-            if "productSpecificationVersion" in f[id_group]:
-                spec_version = f[id_group]["productSpecificationVersion"][...]
+            id_grp = f[id_group]
+            if "productSpecificationVersion" in id_grp:
+                spec_version = id_grp["productSpecificationVersion"][...]
                 spec_version = nisarqa.byte_string_to_python_str(spec_version)
                 nisarqa.get_logger().info(
                     "Input product's"
@@ -270,9 +352,11 @@ class NisarProduct(ABC):
                     # list of Python bytes objects. Boo.
                     # This edge case occurs in some InSAR datasets, and should
                     # be fixed for R4.
-                    list_of_freqs = [
-                        my_str.decode("utf-8") for my_str in list_of_freqs[()]
-                    ]
+                    # Cast to a fixed-width byte string array so that the
+                    # decode happens in a single vectorized call.
+                    list_of_freqs = nisarqa.byte_string_to_python_str(
+                        list_of_freqs[()].astype(np.bytes_)
+                    )
                     # That's what we want to return in this function, but it
                     # does not meet NISAR specs, so log an error.
                     log.error(
@@ -342,9 +426,11 @@ class NisarProduct(ABC):
                     # list of Python bytes objects. Boo.
                     # This edge case occurs in some InSAR datasets, and should
                     # be fixed for R4.
-                    list_of_pols = [
-                        my_str.decode("utf-8") for my_str in list_of_pols[()]
-                    ]
+                    # Cast to a fixed-width byte string array so that the
+                    # decode happens in a single vectorized call.
+                    list_of_pols = nisarqa.byte_string_to_python_str(
+                        list_of_pols[()].astype(np.bytes_)
+                    )
                     # That's what we want to return in this function, but it
                     # does not meet NISAR specs, so log an error.
                     log.error(
@@ -554,23 +640,39 @@ class NisarProduct(ABC):
         if freq not in ("A", "B"):
             raise ValueError(f"{freq=}, must be either 'A' or 'B'")
 
-        # We cannot use functools.lru_cache() on a instance method due to
-        # the `self` parameter, so use an inner function to cache the results.
-        @lru_cache
-        def _freq_path(freq):
-            log = nisarqa.get_logger()
+        freq_group_paths = self._freq_group_paths
+        if freq not in freq_group_paths:
             path = self._data_group_path + f"/frequency{freq}"
-            with h5py.File(self.filepath) as f:
+            errmsg = (
+                f"Input file does not contain frequency {freq} group at"
+                f" path: {path}"
+            )
+            raise nisarqa.DatasetNotFoundError(errmsg)
+
+        return freq_group_paths[freq]
+
+    @cached_property
+    def _freq_group_paths(self) -> dict[str, str]:
+        """
+        Paths to the frequency groups which are present in the input file.
+
+        The frequency groups are located once per product, so that repeated
+        calls to `get_freq_path()` do not re-open the input file.
+
+        Returns
+        -------
+        freq_group_paths : dict of str
+            Maps each frequency found in the input file ("A" and/or "B") to
+            the path inside the input file to that frequency group.
+        """
+        freq_group_paths = {}
+        with h5py.File(self.filepath) as f:
+            for freq in ("A", "B"):
+                path = self._data_group_path + f"/frequency{freq}"
                 if path in f:
-                    return path
-                else:
-                    errmsg = (
-                        f"Input file does not contain frequency {freq} group at"
-                        f" path: {path}"
-                    )
-                    raise nisarqa.DatasetNotFoundError(errmsg)
+                    freq_group_paths[freq] = path
 
-        return _freq_path(freq)
+        return freq_group_paths
 
     @cached_property
     def metadata_path(self) -> str:
@@ -625,16 +727,18 @@ class NisarProduct(ABC):
         id_group = self.identification_path
 
         with h5py.File(self.filepath) as f:
-            if "isGeocoded" in f[id_group]:
+            id_grp = f[id_group]
+            if "isGeocoded" in id_grp:
                 # Check that `isGeocoded` is set correctly, i.e. that it is
                 # False in range Doppler products, and True in Geocoded products
-                ds_handle = f[id_group]["isGeocoded"]
+                ds_handle = id_grp["isGeocoded"]
 
                 # Check that the value has the correct dtype and formatting
                 # (this reports the results to the log)
                 nisarqa.verify_isce3_boolean(ds_handle)
 
-                data = ds_handle[()]
+                raw_data = ds_handle[()]
+                data = raw_data
 
                 if np.issubdtype(data.dtype, np.bytes_):
                     data = nisarqa.byte_string_to_python_str(data)
@@ -648,13 +752,13 @@ class NisarProduct(ABC):
                 if self.is_geocoded != bool(data):
                     log.error(
                         "WARNING `/identification/isGeocoded` field has value"
-                        f" {ds_handle[...]}, which is inconsistent with"
+                        f" {raw_data}, which is inconsistent with"
                         f" product type of {self.product_type}."
                     )
                 else:
                     log.info(
                         "`/identification/isGeocoded` field has value"
-                        f" {ds_handle[...]}, which is consistent with"
+                        f" {raw_data}, which is consistent with"
                         f" product type of {self.product_type}."
                     )
             else:
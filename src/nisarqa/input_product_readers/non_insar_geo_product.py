@@ -14,7 +14,9 @@ objects_to_skip = nisarqa.get_all(name=__name__)
 @dataclass
 class NonInsarGeoProduct(NonInsarProduct, NisarGeoProduct):
     @cached_property
-    def browse_x_range(self) -> tuple[float, float]:
+    def _browse_extent(
+        self,
+    ) -> tuple[tuple[float, float], tuple[float, float]]:
         # All rasters used for the browse should have the same grid specs
         # So, WLOG parse the specs from the first one of them.
         layers = self.get_layers_for_browse()
@@ -22,24 +24,18 @@ class NonInsarGeoProduct(NonInsarProduct, NisarGeoProduct):
         pol = layers[freq][0]
 
         with self.get_raster(freq=freq, pol=pol) as img:
-            x_start = img.x_start
-            x_stop = img.x_stop
-
-        return (x_start, x_stop)
+            x_range = (img.x_start, img.x_stop)
+            y_range = (img.y_start, img.y_stop)
 
-    @cached_property
-    def browse_y_range(self) -> tuple[float, float]:
-        # All rasters used for the browse should have the same grid specs
-        # So, WLOG parse the specs from the first one of them.
-        layers = self.get_layers_for_browse()
-        freq = next(iter(layers.keys()))
-        pol = layers[freq][0]
+        return x_range, y_range
 
-        with self.get_raster(freq=freq, pol=pol) as img:
-            y_start = img.y_start
-            y_stop = img.y_stop
+    @property
+    def browse_x_range(self) -> tuple[float, float]:
+        return self._browse_extent[0]
 
-        return (y_start, y_stop)
+    @property
+    def browse_y_range(self) -> tuple[float, float]:
+        return self._browse_extent[1]
 
 
 __all__ = nisarqa.get_all(__name__, objects_to_skip)
@@ -266,7 +266,7 @@ class NonInsarProduct(NisarProduct):
 
         path = self._layers[freq][pol]
 
-        with h5py.File(self.filepath, "r") as in_file:
+        with self._open_h5_for_rasters() as in_file:
             if path not in in_file:
                 errmsg = f"Input file does not contain raster {path}"
                 raise nisarqa.DatasetNotFoundError(errmsg)
@@ -311,6 +311,8 @@ class NonInsarProduct(NisarProduct):
             Example:
                 layers["A"]["HH"] -> "/science/LSAR/RSLC/swaths/frequencyA/HH"
         """
+        possible_pols = nisarqa.get_possible_pols(self.product_type.lower())
+
         # Discover images in input file and populate the `pols` dictionary
         with h5py.File(self.filepath) as h5_file:
             layers = {}
@@ -318,10 +320,12 @@ class NonInsarProduct(NisarProduct):
                 path = self.get_freq_path(freq=freq)
                 layers[freq] = {}
 
-                for pol in nisarqa.get_possible_pols(self.product_type.lower()):
-                    raster_path = f"{path}/{pol}"
-                    if raster_path in h5_file:
-                        layers[freq][pol] = raster_path
+                # Enumerate the frequency group's members once, rather than
+                # probing the file for every possible polarization path.
+                present = set(h5_file[path].keys())
+                for pol in possible_pols:
+                    if pol in present:
+                        layers[freq][pol] = f"{path}/{pol}"
 
         # Sanity Check - if a band/freq does not have any polarizations,
         # this is a validation error. This check should be handled during
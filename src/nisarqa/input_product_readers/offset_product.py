@@ -110,11 +110,7 @@ class OffsetProduct(InsarProduct):
                     layers_tmp = []
                     for l_num in range(1, 8):
                         path = self._numbered_layer_group_path(freq, pol, l_num)
-                        try:
-                            f[path]
-                        except KeyError:
-                            pass
-                        else:
+                        if path in f:
                             layers_tmp.append(l_num)
 
                     if not layers_tmp:
@@ -223,7 +219,7 @@ class OffsetProduct(InsarProduct):
         parent_path = self._numbered_layer_group_path(freq, pol, layer_num)
         path = f"{parent_path}/alongTrackOffset"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -251,7 +247,7 @@ class OffsetProduct(InsarProduct):
         parent_path = self._numbered_layer_group_path(freq, pol, layer_num)
         path = f"{parent_path}/slantRangeOffset"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -279,7 +275,7 @@ class OffsetProduct(InsarProduct):
         parent_path = self._numbered_layer_group_path(freq, pol, layer_num)
         path = f"{parent_path}/alongTrackOffsetVariance"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -307,7 +303,7 @@ class OffsetProduct(InsarProduct):
         parent_path = self._numbered_layer_group_path(freq, pol, layer_num)
         path = f"{parent_path}/slantRangeOffsetVariance"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -335,7 +331,7 @@ class OffsetProduct(InsarProduct):
         parent_path = self._numbered_layer_group_path(freq, pol, layer_num)
         path = f"{parent_path}/crossOffsetVariance"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -363,7 +359,7 @@ class OffsetProduct(InsarProduct):
         parent_path = self._numbered_layer_group_path(freq, pol, layer_num)
         path = f"{parent_path}/correlationSurfacePeak"
 
-        with h5py.File(self.filepath) as f:
+        with self._open_h5_for_rasters() as f:
             yield self._get_raster_from_path(
                 h5_file=f, raster_path=path, parse_stats=True
             )
@@ -102,24 +102,24 @@ class GUNW(
             return f"{self.get_freq_path(freq)}/unwrappedInterferogram/{pol}"
 
     @cached_property
-    def browse_x_range(self) -> tuple[float, float]:
+    def _browse_extent(
+        self,
+    ) -> tuple[tuple[float, float], tuple[float, float]]:
         freq, pol = self.get_browse_freq_pol()
 
         with self.get_unwrapped_phase(freq, pol) as img:
-            x_start = img.x_start
-            x_stop = img.x_stop
-
-        return (x_start, x_stop)
+            x_range = (img.x_start, img.x_stop)
+            y_range = (img.y_start, img.y_stop)
 
-    @cached_property
-    def browse_y_range(self) -> tuple[float, float]:
-        freq, pol = self.get_browse_freq_pol()
+        return x_range, y_range
 
-        with self.get_unwrapped_phase(freq, pol) as img:
-            y_start = img.y_start
-            y_stop = img.y_stop
+    @property
+    def browse_x_range(self) -> tuple[float, float]:
+        return self._browse_extent[0]
 
-        return (y_start, y_stop)
+    @property
+    def browse_y_range(self) -> tuple[float, float]:
+        return self._browse_extent[1]
 
 
 __all__ = nisarqa.get_all(__name__, objects_to_skip)
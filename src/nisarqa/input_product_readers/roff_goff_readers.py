@@ -26,28 +26,26 @@ class GOFF(OffsetProduct, NisarGeoProduct):
         return "GOFF"
 
     @cached_property
-    def browse_x_range(self) -> tuple[float, float]:
+    def _browse_extent(
+        self,
+    ) -> tuple[tuple[float, float], tuple[float, float]]:
         freq, pol, layer = self.get_browse_freq_pol_layer()
 
         with self.get_along_track_offset(
             freq=freq, pol=pol, layer_num=layer
-        ) as raster:
-            x_start = raster.x_start
-            x_stop = raster.x_stop
-
-        return (x_start, x_stop)
+        ) as img:
+            x_range = (img.x_start, img.x_stop)
+            y_range = (img.y_start, img.y_stop)
 
-    @cached_property
-    def browse_y_range(self) -> tuple[float, float]:
-        freq, pol, layer = self.get_browse_freq_pol_layer()
+        return x_range, y_range
 
-        with self.get_along_track_offset(
-            freq=freq, pol=pol, layer_num=layer
-        ) as raster:
-            y_start = raster.y_start
-            y_stop = raster.y_stop
+    @property
+    def browse_x_range(self) -> tuple[float, float]:
+        return self._browse_extent[0]
 
-        return (y_start, y_stop)
+    @property
+    def browse_y_range(self) -> tuple[float, float]:
+        return self._browse_extent[1]
 
 
 __all__ = nisarqa.get_all(__name__, objects_to_skip)
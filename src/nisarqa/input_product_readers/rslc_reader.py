@@ -208,14 +208,15 @@ class RSLC(SLCProduct, NisarRadarProduct):
             log = nisarqa.get_logger()
             with h5py.File(self.filepath) as f:
                 try:
-                    proc_center_freq = f[path][()]
+                    ds = f[path]
                 except KeyError as e:
                     raise nisarqa.DatasetNotFoundError from e
+                proc_center_freq = ds[()]
 
                 # As of R3.4, units for `processedCenterFrequency` are "Hz",
                 # not MHz. Do a soft check that this the units are correct.
                 try:
-                    units = f[path].attrs["units"]
+                    units = ds.attrs["units"]
                 except KeyError:
                     errmsg = (
                         "`processedCenterFrequency` missing 'units' attribute."
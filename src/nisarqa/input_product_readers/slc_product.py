@@ -13,6 +13,19 @@ from .non_insar_product import NonInsarProduct
 
 objects_to_skip = nisarqa.get_all(name=__name__)
 
+# RGB color channel assignments for the SLC browse image, keyed by the set of
+# polarization images provided. Values are the (red, green, blue) pols.
+_BROWSE_RGB_POLS = {
+    # Quad Pol
+    frozenset({"HH", "HV", "VV"}): ("HH", "HV", "VV"),
+    # dual pol horizontal transmit, or quasi-quad
+    frozenset({"HH", "HV"}): ("HH", "HV", "HH"),
+    # quasi-dual mode
+    frozenset({"HH", "VV"}): ("HH", "VV", "HH"),
+    # dual-pol only, vertical transmit
+    frozenset({"VV", "VH"}): ("VV", "VH", "VV"),
+}
+
 
 @dataclass
 class SLCProduct(NonInsarProduct):
@@ -275,49 +288,29 @@ class SLCProduct(NonInsarProduct):
         # WLOG, get the shape of the image arrays
         # They should all be the same shape; the check for this is below.
         arbitrary_img = next(iter(pol_imgs.values()))
-        img_2D_shape = np.shape(arbitrary_img)
+        img_2D_shape = arbitrary_img.shape
         for img in pol_imgs.values():
             # Input validation check
-            if np.shape(img) != img_2D_shape:
+            if img.shape != img_2D_shape:
                 raise ValueError(
                     "All image arrays in `pol_imgs` must have the same shape."
                 )
 
         # Assign color channels
-        set_of_pol_imgs = set(pol_imgs)
-
-        if set_of_pol_imgs == {"HH", "HV", "VV"}:
-            # Quad Pol
-            red = pol_imgs["HH"]
-            green = pol_imgs["HV"]
-            blue = pol_imgs["VV"]
-        elif set_of_pol_imgs == {"HH", "HV"}:
-            # dual pol horizontal transmit, or quasi-quad
-            red = pol_imgs["HH"]
-            green = pol_imgs["HV"]
-            blue = pol_imgs["HH"]
-        elif set_of_pol_imgs == {"HH", "VV"}:
-            # quasi-dual mode
-            red = pol_imgs["HH"]
-            green = pol_imgs["VV"]
-            blue = pol_imgs["HH"]
-        elif set_of_pol_imgs == {"VV", "VH"}:
-            # dual-pol only, vertical transmit
-            red = pol_imgs["VV"]
-            green = pol_imgs["VH"]
-            blue = pol_imgs["VV"]
-        else:
-            # If we get into this "else" statement, then
-            # either there is only one image provided (e.g. single pol),
+        rgb_pols = _BROWSE_RGB_POLS.get(frozenset(pol_imgs))
+
+        if rgb_pols is None:
+            # Either there is only one image provided (e.g. single pol),
             # or the images provided are not one of the expected cases.
             # Either way, WLOG plot one of the image(s) in `pol_imgs`.
             gray_img = pol_imgs.popitem()[1]
             nisarqa.plot_to_grayscale_png(img_arr=gray_img, filepath=filepath)
 
-            # This `else` is a catch-all clause. Return early, so that
-            # we do not try to plot to RGB
+            # Return early, so that we do not try to plot to RGB
             return
 
+        red, green, blue = (pol_imgs[pol] for pol in rgb_pols)
+
         nisarqa.plot_to_rgb_png(
             red=red, green=green, blue=blue, filepath=filepath
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 from typing import Optional
 
 import nisarqa
@@ -123,9 +123,7 @@ class GCOVRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
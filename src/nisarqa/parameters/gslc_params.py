@@ -174,9 +174,7 @@ class GSLCRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
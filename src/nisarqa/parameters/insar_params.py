@@ -1680,9 +1680,7 @@ class RIFGRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
@@ -1814,9 +1812,7 @@ class RUNWRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
@@ -1972,9 +1968,7 @@ class GUNWRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
@@ -2122,9 +2116,7 @@ class ROFFRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
@@ -2248,9 +2240,7 @@ class GOFFRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
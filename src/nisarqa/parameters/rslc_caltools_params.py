@@ -403,7 +403,7 @@ class BackscatterImageParamGroup(YamlParamGroup, HDF5ParamGroup):
 
         # validate nlooks_freq*
         self._validate_nlooks(self.nlooks_freqa, "A")
-        self._validate_nlooks(self.nlooks_freqa, "B")
+        self._validate_nlooks(self.nlooks_freqb, "B")
 
         # validate longest_side_max
         if not isinstance(self.longest_side_max, int):
@@ -472,8 +472,10 @@ class BackscatterImageParamGroup(YamlParamGroup, HDF5ParamGroup):
             raise TypeError(f"`tile_shape` must have a length of two: {val}")
         if not all(isinstance(e, int) for e in val):
             raise TypeError(f"`tile_shape` must contain only integers: {val}")
-        if any(e < -1 for e in val):
-            raise TypeError(f"Values in `tile_shape` must be >= -1: {val}")
+        if any((e < 1) and (e != -1) for e in val):
+            raise ValueError(
+                f"Values in `tile_shape` must be positive or -1: {val}"
+            )
 
         # SET ATTRIBUTES DEPENDENT UPON INPUT PARAMETERS
         # This dataclass is frozen to ensure that all inputs are validated,
@@ -502,16 +504,20 @@ class BackscatterImageParamGroup(YamlParamGroup, HDF5ParamGroup):
             The frequency to assign this number of looks to.
             Options: 'A' or 'B'
         """
-        if isinstance(nlooks, (list, tuple)):
-            if all(isinstance(e, int) for e in nlooks):
-                if any((e < 1) for e in nlooks) or not len(nlooks) == 2:
-                    raise TypeError(
-                        f"nlooks_freq{freq.lower()} must be an int or a "
-                        f"sequence of two ints, which are >= 1: {nlooks}"
-                    )
-        elif nlooks is None:
+        if nlooks is None:
             # the code will use `longest_side_max` to compute `nlooks` instead.
-            pass
+            return
+
+        if isinstance(nlooks, (list, tuple)):
+            if (
+                len(nlooks) != 2
+                or not all(isinstance(e, int) for e in nlooks)
+                or min(nlooks) < 1
+            ):
+                raise TypeError(
+                    f"nlooks_freq{freq.lower()} must be a sequence of two"
+                    f" ints, which are >= 1: {nlooks}"
+                )
         else:
             raise TypeError(
                 f"`nlooks` must be of type iterable of int, or None: {nlooks}"
@@ -761,8 +767,10 @@ class HistogramParamGroup(YamlParamGroup, HDF5ParamGroup):
             raise TypeError(f"`tile_shape` must have a length of two: {val}")
         if not all(isinstance(e, int) for e in val):
             raise TypeError(f"`tile_shape` must contain only integers: {val}")
-        if any(e < -1 for e in val):
-            raise TypeError(f"Values in `tile_shape` must be >= -1: {val}")
+        if any((e < 1) and (e != -1) for e in val):
+            raise ValueError(
+                f"Values in `tile_shape` must be positive or -1: {val}"
+            )
 
         # SET ATTRIBUTES DEPENDENT UPON INPUT PARAMETERS
         # This dataclass is frozen to ensure that all inputs are validated,
@@ -1145,9 +1153,7 @@ class RSLCRootParamGroup(RootParamGroup):
     def get_mapping_of_workflows2param_grps(workflows):
         Grp = RootParamGroup.ReqParamGrp  # class object for our named tuple
 
-        flag_any_workflows_true = any(
-            [getattr(workflows, field.name) for field in fields(workflows)]
-        )
+        flag_any_workflows_true = workflows.at_least_one_wkflw_requested()
 
         grps_to_parse = (
             Grp(
@@ -303,7 +303,9 @@ def compute_nan_count(arr: ArrayLike) -> int:
     """
     # np.isnan works for both real and complex data. For complex data, if
     # either the real or imag part is NaN, then the pixel is considered NaN.
-    return np.sum(np.isnan(arr))
+    # Use np.count_nonzero() rather than np.sum() on the boolean mask; it is
+    # a dedicated reduction which avoids upcasting each element to an integer.
+    return np.count_nonzero(np.isnan(arr))
 
 
 def compute_inf_count(arr: ArrayLike) -> int:
@@ -324,7 +326,7 @@ def compute_inf_count(arr: ArrayLike) -> int:
     """
     # (np.isinf works for both real and complex data. For complex data, if
     # either real or imag part is +/- inf, then the pixel is considered inf.)
-    return np.sum(np.isinf(arr))
+    return np.count_nonzero(np.isinf(arr))
 
 
 def compute_fill_count(
@@ -349,7 +351,7 @@ def compute_fill_count(
         # `np.nan == np.nan` evaluates to False, so handle this case here
         return compute_nan_count(arr=arr)
 
-    return np.sum(np.equal(arr, fill_value))
+    return np.count_nonzero(np.equal(arr, fill_value))
 
 
 def compute_near_zero_count(arr: ArrayLike, epsilon: float = 1e-6) -> int:
@@ -371,7 +373,7 @@ def compute_near_zero_count(arr: ArrayLike, epsilon: float = 1e-6) -> int:
         Number of near-zero elements in `arr`.
     """
     # By using np.abs(), for complex values this will compute the magnitude.
-    return np.sum(np.abs(arr) < epsilon)
+    return np.count_nonzero(np.abs(arr) < epsilon)
 
 
 def compute_percentage_metrics(
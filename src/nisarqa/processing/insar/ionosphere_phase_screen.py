@@ -162,8 +162,15 @@ def plot_ionosphere_phase_screen_to_pdf(
         rewrap=2.0,
     )
 
-    # Step 2: adjust to (-pi, pi].
-    iono_arr = np.where(iono_arr > np.pi, iono_arr - (2.0 * np.pi), iono_arr)
+    # Decimate to fit nicely on the figure. Rewrapping is pointwise, so do
+    # this first to only adjust the pixels which will be plotted.
+    iono_arr = downsample_img_to_size_of_axes(
+        ax=ax1, arr=iono_arr, mode="decimate"
+    )
+
+    # Step 2: adjust to (-pi, pi]. `iono_arr` is a copy of the
+    # raster data, so it can safely be adjusted in-place.
+    iono_arr[iono_arr > np.pi] -= 2.0 * np.pi
     cbar_min_max = [-np.pi, np.pi]
 
     epsilon = 1e-6
@@ -171,17 +178,13 @@ def plot_ionosphere_phase_screen_to_pdf(
     iono_arr_max = np.nanmax(iono_arr)
     if np.isnan(iono_arr_min) and np.isnan(iono_arr_max):
         nisarqa.get_logger().warning(
-            "The ionosphere phase screen layer contains all NaN values."
+            "The decimated ionosphere phase screen image contains all NaN"
+            " values."
         )
     else:
         assert iono_arr_min >= (-np.pi - epsilon)
         assert iono_arr_max <= (np.pi + epsilon)
 
-    # Decimate to fit nicely on the figure.
-    iono_arr = downsample_img_to_size_of_axes(
-        ax=ax1, arr=iono_arr, mode="decimate"
-    )
-
     # Add the wrapped phase image plot
     im = ax1.imshow(
         iono_arr,
@@ -196,7 +199,7 @@ def plot_ionosphere_phase_screen_to_pdf(
         ax=ax1,
         xlim=iono_raster.x_axis_limits,
         ylim=iono_raster.y_axis_limits,
-        img_arr_shape=np.shape(iono_arr),
+        img_arr_shape=iono_arr.shape,
         xlabel=iono_raster.x_axis_label,
         ylabel=iono_raster.y_axis_label,
         title=(
@@ -237,7 +240,7 @@ def plot_ionosphere_phase_screen_to_pdf(
     format_axes_ticks_and_labels(
         ax=ax2,
         xlim=iono_uncertainty_raster.x_axis_limits,
-        img_arr_shape=np.shape(uncertainty_arr),
+        img_arr_shape=uncertainty_arr.shape,
         xlabel=iono_uncertainty_raster.x_axis_label,
         title=iono_uncertainty_raster.name.split("_")[-1],
     )
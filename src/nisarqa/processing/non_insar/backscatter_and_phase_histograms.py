@@ -159,11 +159,15 @@ def generate_backscatter_image_histogram_single_freq(
             else nisarqa.arr2pow(arr)
         )
 
+        # Convert to dB. `power` is a new array (not a view of the input
+        # raster), so do this in-place to avoid full-tile temporaries.
+        # (Equivalent to `nisarqa.pow2db(power)`.)
         with nisarqa.ignore_runtime_warnings():
             # This line throws these warnings:
             #   "RuntimeWarning: divide by zero encountered in log10"
             # when there are zero values. Ignore those warnings.
-            power = nisarqa.pow2db(power)
+            np.log10(power, out=power)
+        power *= 10.0
 
         return power
 
@@ -486,8 +490,13 @@ def compute_histogram_by_tiling(
 
     # Shrink the tile shape to be an even multiple of the decimation ratio.
     # Otherwise, the decimation will get messy to book-keep.
+    # When possible, also align the tiles to the input's chunk grid so that
+    # each compressed chunk is only decompressed once during the scan.
     in_tiling_shape = tuple(
-        [m - (m % n) for m, n in zip(tile_shape, decimation_ratio)]
+        nisarqa.align_tile_dim_to_chunks(
+            arr, axis=axis, tile_dim=m, multiple_of=n
+        )
+        for axis, (m, n) in enumerate(zip(tile_shape, decimation_ratio))
     )
 
     # Create the Iterator over the input array
@@ -507,7 +516,7 @@ def compute_histogram_by_tiling(
 
     # Do calculation and accumulate the counts
     for tile_slice in input_iter:
-        arr_slice = arr[tile_slice]
+        arr_slice = nisarqa.read_tile(arr, tile_slice)
 
         # Remove invalid entries
         # Note: for generating histograms, we do not need to retain the
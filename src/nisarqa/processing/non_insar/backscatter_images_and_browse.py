@@ -401,10 +401,17 @@ def compute_multilooked_backscatter_by_tiling(
     if tile_shape[1] < nlooks[1]:
         tile_shape = (tile_shape[0], nlooks[1])
 
-    # Next, shrink the tile shape to be an integer multiple of nlooks
-    in_tiling_shape = tuple([(m // n) * n for m, n in zip(tile_shape, nlooks)])
+    # Next, shrink the tile shape to be an integer multiple of nlooks.
+    # When possible, also align the tiles to the input's chunk grid so that
+    # each compressed chunk is only read and decompressed once.
+    in_tiling_shape = tuple(
+        nisarqa.align_tile_dim_to_chunks(
+            arr, axis=axis, tile_dim=m, multiple_of=n
+        )
+        for axis, (m, n) in enumerate(zip(tile_shape, nlooks))
+    )
 
-    out_tiling_shape = tuple([m // n for m, n in zip(tile_shape, nlooks)])
+    out_tiling_shape = tuple([m // n for m, n in zip(in_tiling_shape, nlooks)])
 
     # Create the Iterators
     input_iter = nisarqa.TileIterator(
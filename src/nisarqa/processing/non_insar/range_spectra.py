@@ -292,7 +292,7 @@ def compute_range_spectra_by_tiling(
 
     for tile_slice in input_iter:
         S_avg += _get_s_avg_for_tile(
-            arr_slice=arr[tile_slice],
+            arr_slice=nisarqa.read_tile(arr, tile_slice),
             fft_axis=1,  # Compute fft over range axis (axis 1)
             num_fft_bins=ncols,
             averaging_denominator=num_range_lines,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 import warnings
 
+import h5py
 import numpy as np
 from numpy.typing import ArrayLike, DTypeLike
 
@@ -116,6 +118,90 @@ class TileIterator:
                 ]
 
 
+def read_tile(arr: ArrayLike, tile_slice: tuple[slice, ...]) -> np.ndarray:
+    """
+    Read a (possibly strided) tile from an array into memory.
+
+    Strided selections on an h5py.Dataset (e.g. `ds[0:1024:5, ::5]`) are
+    resolved by HDF5 as a hyperslab selection of individual elements, which is
+    far slower than reading the same region contiguously. Because every chunk
+    overlapped by the tile must be read and decompressed in either case, for
+    h5py.Datasets this function reads the contiguous block spanned by
+    `tile_slice` and applies the strides in memory.
+
+    Parameters
+    ----------
+    arr : array_like
+        Input array, e.g. a numpy.ndarray or an h5py.Dataset.
+    tile_slice : tuple of slice
+        Slices defining the tile to read from `arr`, such as the slices
+        yielded by a TileIterator.
+
+    Returns
+    -------
+    tile : numpy.ndarray
+        The requested tile of `arr`. For numpy arrays, this is `arr[tile_slice]`.
+    """
+    if not isinstance(arr, h5py.Dataset):
+        return arr[tile_slice]
+
+    # TileIterator always sets the step, with a default stride of 1
+    if all(s.step in (None, 1) for s in tile_slice):
+        return arr[tile_slice]
+
+    contiguous = tuple(slice(s.start, s.stop) for s in tile_slice)
+    strides = tuple(slice(None, None, s.step) for s in tile_slice)
+
+    return arr[contiguous][strides]
+
+
+def align_tile_dim_to_chunks(
+    arr: ArrayLike, axis: int, tile_dim: int, multiple_of: int = 1
+) -> int:
+    """
+    Shrink a tile dimension to align with the HDF5 chunk grid of `arr`.
+
+    When tiles straddle chunk boundaries, HDF5 must read and decompress the
+    straddled chunks once for each tile that touches them. Aligning the tile
+    edges to the chunk grid ensures each chunk is decompressed once per pass.
+
+    Parameters
+    ----------
+    arr : array_like
+        The array which will be iterated over by tiles.
+    axis : int
+        The axis of `arr` which `tile_dim` corresponds to.
+    tile_dim : int
+        Requested number of elements along `axis` for each tile.
+    multiple_of : int, optional
+        The returned tile dimension will be an integer multiple of this value,
+        e.g. a decimation stride or number of looks along `axis`.
+        Defaults to 1.
+
+    Returns
+    -------
+    aligned_tile_dim : int
+        `tile_dim`, shrunk to be an integer multiple of `multiple_of`.
+        If `arr` is a chunked h5py.Dataset and the tiles do not already
+        span all of `axis`, it is further shrunk to be an integer multiple of
+        the chunk dimension along `axis` (if that is possible without shrinking
+        `aligned_tile_dim` to zero).
+    """
+    tile_dim -= tile_dim % multiple_of
+
+    if not isinstance(arr, h5py.Dataset) or (arr.chunks is None):
+        return tile_dim
+    if tile_dim >= arr.shape[axis]:
+        # Only one tile along this axis; nothing to align
+        return tile_dim
+
+    unit = math.lcm(arr.chunks[axis], multiple_of)
+    if tile_dim >= unit:
+        tile_dim -= tile_dim % unit
+
+    return tile_dim
+
+
 def process_arr_by_tiles(
     in_arr, out_arr, func, input_batches, output_batches, in_arr_2=None
 ):
@@ -151,9 +237,11 @@ def process_arr_by_tiles(
     for out_slice, in_slice in zip(output_batches, input_batches):
         # Process this batch
         if in_arr_2 is None:
-            tmp_out = func(in_arr[in_slice])
+            tmp_out = func(read_tile(in_arr, in_slice))
         else:
-            tmp_out = func(in_arr[in_slice], in_arr_2[in_slice])
+            tmp_out = func(
+                read_tile(in_arr, in_slice), read_tile(in_arr_2, in_slice)
+            )
 
         # Write the batch output to the output array
         out_arr[out_slice] = tmp_out
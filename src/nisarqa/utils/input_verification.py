@@ -331,6 +331,43 @@ def _get_nisar_integer_seconds_regex(require_t: bool = True) -> str:
         return r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}"
 
 
+# Datetime validation runs for every string Dataset and Attribute in the
+# input product, so compile the fixed regex Patterns once at import time.
+
+# Datetime value substring, e.g. "2023-10-31T11:59:32.123". The "T" is
+# optional, and any number of decimal digits is allowed.
+_DATETIME_VALUE_PATTERN = re.compile(
+    rf"{_get_nisar_integer_seconds_regex(require_t=False)}(?:\.\d+)?"
+)
+
+# Datetime template substring, e.g. "YYYY-mm-ddTHH:MM:SS.sss". The "T" is
+# optional, and decimal digits are denoted by lowercase "s"s.
+_DATETIME_TEMPLATE_REGEX = _get_nisar_integer_seconds_template().replace(
+    "T", "[T ]"
+)
+_DATETIME_TEMPLATE_PATTERN = re.compile(rf"{_DATETIME_TEMPLATE_REGEX}(?:\.s+)?")
+
+# Full datetime template string, with a named capturing group for the
+# decimal digits
+_DATETIME_TEMPLATE_DECIMALS_PATTERN = re.compile(
+    rf"^{_DATETIME_TEMPLATE_REGEX}(\.(?P<decimals>s+))?$"
+)
+
+# NISAR datetime conventions, keyed by precision
+_NISAR_DATETIME_CONVENTIONS = {
+    "seconds": (
+        _get_nisar_integer_seconds_template(),
+        re.compile(f"^{_get_nisar_integer_seconds_regex(require_t=True)}$"),
+    ),
+    "nanoseconds": (
+        f"{_get_nisar_integer_seconds_template()}.sssssssss",
+        re.compile(
+            rf"^{_get_nisar_integer_seconds_regex(require_t=True)}\.\d{{9}}$"
+        ),
+    ),
+}
+
+
 def get_nisar_datetime_format_conventions(
     precision: str,
 ) -> tuple[str, re.Pattern]:
@@ -369,20 +406,12 @@ def get_nisar_datetime_format_conventions(
         `zeroDopplerEndTime`, use nanosecond precision.
     """
 
-    template_integer_sec = _get_nisar_integer_seconds_template()  # includes T
-    regex_integer_sec = _get_nisar_integer_seconds_regex(require_t=True)
-
-    if precision == "seconds":
-        template = template_integer_sec
-        regex = f"^{regex_integer_sec}$"
-    elif precision == "nanoseconds":
-        template = f"{template_integer_sec}.sssssssss"
-        require_decimals = r"\.\d{9}"
-        regex = f"^{regex_integer_sec}{require_decimals}$"
-    else:
-        raise ValueError(f"{precision=!r}, must be 'seconds' or 'nanoseconds'.")
-
-    return template, re.compile(regex)
+    try:
+        return _NISAR_DATETIME_CONVENTIONS[precision]
+    except KeyError:
+        raise ValueError(
+            f"{precision=!r}, must be 'seconds' or 'nanoseconds'."
+        ) from None
 
 
 def verify_nisar_datetime_template_string(
@@ -505,15 +534,7 @@ def contains_datetime_template_substring(input_str: str) -> bool:
         True if there is at least one datetime template substring contained
         in the input string. False if not.
     """
-
-    template_sec = _get_nisar_integer_seconds_template()
-
-    # convert to a regex to make the T optional...
-    regex = template_sec.replace("T", "[T ]")
-    # ...and allow for optional decimal digits (denoted by lowercase "s"s)
-    pattern = re.compile(rf"{regex}(?:\.s+)?")
-
-    match = pattern.search(input_str)
+    match = _DATETIME_TEMPLATE_PATTERN.search(input_str)
 
     return match is not None
 
@@ -553,15 +574,7 @@ def extract_datetime_template_substring(
         with multiple datetime strings; handling these edge cases would
         cause unncessary code complexity.
     """
-
-    template_sec = _get_nisar_integer_seconds_template()
-
-    # convert to a regex to make the T optional...
-    regex = template_sec.replace("T", "[T ]")
-    # ...and allow for optional decimal digits (denoted by lowercase "s"s)
-    pattern = re.compile(rf"{regex}(?:\.s+)?")
-
-    matches = pattern.findall(input_str)
+    matches = _DATETIME_TEMPLATE_PATTERN.findall(input_str)
 
     # input string should contain exactly one instance of a datetime template
     if len(matches) != 1:
@@ -596,13 +609,7 @@ def contains_datetime_value_substring(input_str: str) -> bool:
         True if there is at least one datetime substring contained in the
         input string. False if not.
     """
-
-    regex_int = _get_nisar_integer_seconds_regex(require_t=False)
-
-    # Include optional decimal digits group in the regex
-    pattern = re.compile(rf"{regex_int}(?:\.\d+)?")
-
-    match = pattern.search(input_str)
+    match = _DATETIME_VALUE_PATTERN.search(input_str)
 
     return match is not None
 
@@ -640,12 +647,7 @@ def extract_datetime_value_substring(input_str: str, dataset_name: str) -> str:
         with multiple datetime strings; handling these edge cases would
         cause unncessary code complexity.
     """
-    regex_int = _get_nisar_integer_seconds_regex(require_t=False)
-
-    # Include optional decimal digits group in the regex
-    pattern = re.compile(rf"{regex_int}(?:\.\d+)?")
-
-    matches = pattern.findall(input_str)
+    matches = _DATETIME_VALUE_PATTERN.findall(input_str)
 
     # input string should contain exactly one instance of a datetime string
     if len(matches) != 1:
@@ -700,14 +702,7 @@ def verify_datetime_string_matches_template(
     log = nisarqa.get_logger()
 
     # Step 1: Compute number of decimal digits in template string
-    # Get the canonical template string (should be "YYYY-mm-ddTHH:MM:SS")
-    template_sec = _get_nisar_integer_seconds_template()
-
-    # Convert to a regex to make the T optional and use a named capturing group
-    # to capture the decimal digits
-    regex_tmpl = rf"^{template_sec.replace('T', '[T ]')}(\.(?P<decimals>s+))?$"
-
-    tmpl_pattern = re.compile(regex_tmpl)
+    tmpl_pattern = _DATETIME_TEMPLATE_DECIMALS_PATTERN
     template_match = tmpl_pattern.search(dt_template_str)
 
     if template_match is None:
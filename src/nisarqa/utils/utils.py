@@ -256,7 +256,19 @@ def create_dataset_in_h5group(
             " `ds_units` for numeric but unitless datasets."
         )
 
-    grp = h5_file.require_group(grp_path)
+    # Equivalent to `h5_file.require_group(grp_path)`, but that first checks
+    # `grp_path in h5_file`, which is several times slower than the lookup
+    # itself. This function is called for every dataset in the STATS.h5 file.
+    try:
+        grp = h5_file[grp_path]
+    except KeyError:
+        grp = h5_file.create_group(grp_path)
+    else:
+        if not isinstance(grp, h5py.Group):
+            raise TypeError(
+                f"`{grp_path=}` exists in the HDF5 file, but is a"
+                f" {type(grp).__name__}, not a Group."
+            )
 
     # Create Dataset
     ds = grp.create_dataset(
@@ -322,6 +334,45 @@ def add_attribute_to_h5_object(
     )
 
 
+def read_small_h5_dataset(ds: h5py.Dataset) -> np.ndarray | np.generic:
+    """
+    Read the full contents of a small h5py.Dataset via the low-level API.
+
+    Functionally equivalent to `ds[()]`, but bypasses h5py's high-level
+    selection machinery and calls H5Dread directly. For the many tiny
+    scalar/1D metadata Datasets in a NISAR product (e.g. those in the
+    `identification` group), the high-level indexing overhead dominates the
+    actual I/O, so this is noticeably faster.
+
+    Parameters
+    ----------
+    ds : h5py.Dataset
+        Handle to the Dataset to read.
+
+    Returns
+    -------
+    data : numpy.ndarray or numpy.generic
+        Contents of `ds`. Scalar Datasets are returned as NumPy scalars,
+        matching the behavior of `ds[()]`.
+
+    Notes
+    -----
+    Datasets with a null dataspace or with variable-length (e.g. string)
+    dtypes cannot be read directly into a preallocated NumPy buffer; for
+    these, this function falls back to `ds[()]`.
+    """
+    if (
+        (ds.shape is None)
+        or (ds.dtype.kind == "O")
+        or (h5py.check_vlen_dtype(ds.dtype) is not None)
+    ):
+        return ds[()]
+
+    out = np.empty(ds.shape, dtype=ds.dtype)
+    ds.id.read(h5py.h5s.ALL, h5py.h5s.ALL, out)
+    return out[()]
+
+
 def multi_line_string_iter(multiline_str):
     """
     Iterator for a multi-line string.
@@ -632,9 +683,12 @@ def load_user_runconfig(
     user_rncfg : nisarqa.typing.RunConfigDict
         `runconfig_yaml` loaded into a dict format
     """
-    # parse runconfig into a dict structure
+    # parse runconfig into a dict structure.
+    # With `typ="safe"`, ruamel.yaml uses the LibYAML-backed C parser
+    # (from `ruamel.yaml.clib`). Open in binary mode so that the parser
+    # handles decoding, rather than decoding in Python first.
     parser = YAML(typ="safe")
-    with open(runconfig_yaml, "r") as f:
+    with open(runconfig_yaml, "rb") as f:
         user_rncfg = parser.load(f)
     return user_rncfg
 
@@ -461,7 +461,11 @@ def _lut_has_finite_pixels(ds: MetadataLUTT) -> bool:
         is all non-finite, it is also considered malformed and we return False.
     """
     log = nisarqa.get_logger()
-    if not np.isfinite(ds.data).any():
+
+    # Compute the mask once; it is reused for the per-layer check below.
+    is_finite = np.isfinite(ds.data)
+
+    if not is_finite.any():
         log.error(
             f"Metadata LUT {ds.name} contains all non-finite"
             " (e.g. NaN) values."
@@ -470,13 +474,15 @@ def _lut_has_finite_pixels(ds: MetadataLUTT) -> bool:
 
     # For 3-D LUTs, check each z-layer individually for all-NaN values.
     if isinstance(ds, MetadataLUT3D):
-        for z in range(ds.shape[0]):
-            if not np.isfinite(ds.data[z, :, :]).any():
-                log.error(
-                    f"Metadata LUT {ds.name} z-axis layer number {z}"
-                    " contains all non-finite (e.g. NaN) values."
-                )
-                return False
+        layer_has_finite = is_finite.reshape(ds.shape[0], -1).any(axis=1)
+        if not layer_has_finite.all():
+            # Report the first offending layer
+            z = np.argmin(layer_has_finite)
+            log.error(
+                f"Metadata LUT {ds.name} z-axis layer number {z}"
+                " contains all non-finite (e.g. NaN) values."
+            )
+            return False
 
     return True
 
@@ -502,7 +508,10 @@ def _lut_is_not_all_zeros(ds: MetadataLUTT) -> bool:
     """
     log = nisarqa.get_logger()
 
-    if np.all(np.abs(ds.data) < 1e-12):
+    # Compute the mask once; it is reused for the per-layer check below.
+    is_near_zero = np.abs(ds.data) < 1e-12
+
+    if is_near_zero.all():
         # This check is likely to raise a lot of failures.
         # We do not want to halt processing during CalVal.
         # So, issue obnoxious warnings for now.
@@ -515,18 +524,20 @@ def _lut_is_not_all_zeros(ds: MetadataLUTT) -> bool:
 
     # For 3-D LUTs, check each z-layer individually for all near-zero values.
     if isinstance(ds, MetadataLUT3D):
-        for z in range(ds.shape[0]):
-            if np.all(np.abs(ds.data[z, :, :]) < 1e-12):
-                # This check is likely to raise a lot of failures.
-                # We do not want to halt processing during CalVal.
-                # So, issue obnoxious warnings for now.
-                # TODO - refine this check during CalVal once real data comes back.
-                msg = (
-                    f"Metadata LUT {ds.name} z-axis layer number {z}"
-                    " contains all near-zero (<1e-12) values."
-                )
-                log.warning(msg)
-                return False
+        layer_is_near_zero = is_near_zero.reshape(ds.shape[0], -1).all(axis=1)
+        if layer_is_near_zero.any():
+            # Report the first offending layer
+            z = np.argmax(layer_is_near_zero)
+            # This check is likely to raise a lot of failures.
+            # We do not want to halt processing during CalVal.
+            # So, issue obnoxious warnings for now.
+            # TODO - refine this check during CalVal once real data comes back.
+            msg = (
+                f"Metadata LUT {ds.name} z-axis layer number {z}"
+                " contains all near-zero (<1e-12) values."
+            )
+            log.warning(msg)
+            return False
     return True
 
 
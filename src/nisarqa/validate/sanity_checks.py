@@ -47,17 +47,27 @@ def identification_sanity_checks(
 
     log = nisarqa.get_logger()
 
+    # The `identification` group holds dozens of small scalar and 1D Datasets.
+    # Enumerate the group and read each Dataset exactly once up front, so
+    # that the checks below are dictionary lookups instead of HDF5 reads.
+    keys_in_product = set(id_group.keys())
+    id_contents = {
+        name: nisarqa.read_small_h5_dataset(obj)
+        for name, obj in id_group.items()
+        if isinstance(obj, h5py.Dataset)
+    }
+
     def _full_path(ds_name: str) -> str:
         return f"{id_group.name}/{ds_name}"
 
     def _dataset_exists(ds_name: str) -> bool:
-        if ds_name not in id_group:
+        if ds_name not in keys_in_product:
             log.error(f"Missing dataset: {_full_path(ds_name)}")
             return False
         return True
 
     def _get_dataset(ds_name: str) -> np.ndarray | np.bytes_:
-        return id_group[ds_name][()]
+        return id_contents[ds_name]
 
     def _get_integer_dataset(ds_name: str) -> int | None:
         data = _get_dataset(ds_name=ds_name)
@@ -467,7 +477,6 @@ def identification_sanity_checks(
                 passes = False
 
     # Log if any Datasets were not verified
-    keys_in_product = set(id_group.keys())
     difference = keys_in_product - ds_checked
     if len(difference) > 0:
         log.warning(
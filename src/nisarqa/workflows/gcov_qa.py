@@ -37,7 +37,6 @@ def gcov_qa(
 
     # For readibility, store possible output filenames in variables.
     input_file = root_params.input_f.qa_input_file
-    out_dir = root_params.get_output_dir()
     report_file = out_dir / root_params.get_report_pdf_filename()
     stats_file = out_dir / root_params.get_stats_h5_filename()
     summary_file = out_dir / root_params.get_summary_csv_filename()
@@ -99,6 +98,8 @@ def gcov_qa(
 
         # TODO - this GCOV validation check should be integrated into
         # the actual product validation. For now, we'll leave it here.
+        # Collect all unsupported terms, so that they are reported together.
+        bad_pols: list[str] = []
         for freq in product.freqs:
             for pol in product.get_pols(freq=freq):
                 if pol in nisarqa.GCOV_DIAG_POLS:
@@ -108,11 +109,13 @@ def gcov_qa(
                         f"GCOV product contains off-diagonal term {pol}."
                     )
                 else:
-                    raise nisarqa.InvalidNISARProductError(
-                        f"Polzarization '{pol}' was found in input product."
-                        " GCOV products can only contain polarizations: "
-                        f" {nisarqa.GCOV_DIAG_POLS + nisarqa.GCOV_OFF_DIAG_POLS}."
-                    )
+                    bad_pols.append(f"frequency{freq}/{pol}")
+        if bad_pols:
+            raise nisarqa.InvalidNISARProductError(
+                f"Polarizations {bad_pols} were found in input product."
+                " GCOV products can only contain polarizations: "
+                f" {nisarqa.GCOV_DIAG_POLS + nisarqa.GCOV_OFF_DIAG_POLS}."
+            )
 
     if root_params.workflows.qa_reports:
         log.info(f"Beginning `qa_reports` processing...")
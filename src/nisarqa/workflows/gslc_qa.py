@@ -39,7 +39,6 @@ def gslc_qa(
     # Depending on which workflows are set to True, not all filename
     # variables will be used.
     input_file = root_params.input_f.qa_input_file
-    out_dir = root_params.get_output_dir()
     report_file = out_dir / root_params.get_report_pdf_filename()
     stats_file = out_dir / root_params.get_stats_h5_filename()
     summary_file = out_dir / root_params.get_summary_csv_filename()
@@ -66,7 +66,6 @@ def igram_qa(
     # Depending on which workflows are set to True, not all filename
     # variables will be used.
     input_file = root_params.input_f.qa_input_file
-    out_dir = root_params.get_output_dir()
     browse_file_png = out_dir / root_params.get_browse_png_filename()
     browse_file_kml = out_dir / root_params.get_kml_browse_filename()
     report_file = out_dir / root_params.get_report_pdf_filename()